@@ -93,6 +93,13 @@ class SystemJournelingManager:
         """
         return self.currentLevel
 
+    def isDebugEnabled(self) -> bool:
+        """
+        Check whether debug (and scope) messages would be recorded.
+        Lets hot paths skip building log messages that would be dropped.
+        """
+        return self.currentLevel.value >= SystemJournelingLevel.DEBUG.value
+
     def recordError(self, message: str, exc_info: bool = False) -> None:
         """
         Record an error message if current level is >= ERROR.
@@ -0,0 +1,187 @@
+"""
+Visual Cortex Kernels - Compiled inner loops for the visual integration area
+
+The Game of Life kernels are JIT compiled with Numba when it is installed,
+with a NumPy bitboard implementation as the fallback. To avoid the
+first-call compile stall on the device, the Numba kernels can also be
+compiled ahead of time into a ``visual_kernels`` extension module next to
+this file:
+
+    python -m Mind.OccipitalLobe.VisualCortex._kernels
+
+The integration area prefers that module over the JIT versions when present.
+"""
+
+import logging
+import os
+from typing import Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Use Numba for the Game of Life kernel if available, otherwise fall back to NumPy
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.info("Numba not available, using NumPy Game of Life kernel")
+
+_U64_1 = np.uint64(1)
+_U64_63 = np.uint64(63)
+
+def pack_bitboard(grid: np.ndarray) -> np.ndarray:
+    """Pack a 64x64 uint8 grid into 64 uint64 rows (bit x holds column x)"""
+    return np.packbits(grid, axis=1, bitorder="little").view("<u8").ravel()
+
+def unpack_bitboard(bitgrid: np.ndarray) -> np.ndarray:
+    """Unpack uint64 rows (with any leading dimensions) back into uint8 cells"""
+    rows = bitgrid.astype("<u8").view(np.uint8).reshape(*bitgrid.shape, 8)
+    return np.unpackbits(rows, axis=-1, bitorder="little").reshape(*bitgrid.shape[:-1], 64, 64)
+
+def gol_step_bitboard(bitgrid: np.ndarray) -> tuple:
+    """
+    Advance one Game of Life generation on a 64-row bitboard
+    
+    Each row is a uint64 holding 64 cells, so every bitwise operation
+    processes a full row. The eight neighbor masks are summed with a
+    half-adder chain into four bit planes (count = c0 + 2*c1 + 4*c2 + 8*c3).
+    
+    Args:
+        bitgrid: 64 uint64 rows of cell states
+        
+    Returns:
+        tuple: (next generation rows, (c0, c1, c2, c3) neighbor count planes)
+    """
+    c0 = np.zeros_like(bitgrid)
+    c1 = np.zeros_like(bitgrid)
+    c2 = np.zeros_like(bitgrid)
+    c3 = np.zeros_like(bitgrid)
+    
+    up = np.roll(bitgrid, 1)     # Row y-1 aligned with row y
+    down = np.roll(bitgrid, -1)  # Row y+1 aligned with row y
+    for rows, include_self in ((up, True), (bitgrid, False), (down, True)):
+        masks = [
+            (rows << _U64_1) | (rows >> _U64_63),  # Column x-1 (wrapping)
+            (rows >> _U64_1) | (rows << _U64_63),  # Column x+1 (wrapping)
+        ]
+        if include_self:
+            masks.append(rows)
+        for m in masks:
+            carry0 = c0 & m
+            c0 ^= m
+            carry1 = c1 & carry0
+            c1 ^= carry0
+            carry2 = c2 & carry1
+            c2 ^= carry1
+            c3 |= carry2
+    
+    # Alive next if count == 3, or alive and count == 2
+    next_bits = c1 & ~c2 & ~c3 & (c0 | bitgrid)
+    return next_bits, (c0, c1, c2, c3)
+
+def gol_step_numpy(grid: np.ndarray, new_grid: np.ndarray, rgb: np.ndarray, padded: Optional[np.ndarray] = None) -> None:
+    """
+    Advance one Game of Life generation using the NumPy bitboard kernel
+    
+    Args:
+        grid: Current 64x64 cell states
+        new_grid: Output buffer for the next generation
+        rgb: Output 64x64x3 buffer colored by neighbor count
+        padded: Unused scratch buffer, accepted for parity with the Numba kernel
+    """
+    next_bits, planes = gol_step_bitboard(pack_bitboard(grid))
+    
+    # Unpack the next generation and all count planes in one pass
+    unpacked = unpack_bitboard(np.stack((next_bits,) + planes))
+    new_grid[:] = unpacked[0]
+    neighbors = unpacked[1] | (unpacked[2] << 1) | (unpacked[3] << 2) | (unpacked[4] << 3)
+    mask = grid == 1
+    live_neighbors = neighbors[mask].astype(np.int16)
+    rgb[:] = 0
+    rgb[mask, 1] = np.minimum(255, live_neighbors * 40)
+    rgb[mask, 2] = 255 - live_neighbors * 20
+
+def stamp_region_numpy(grid: np.ndarray, region: np.ndarray, x: int, y: int) -> None:
+    """
+    Set the grid cells under the live cells of a region, clipped to the grid
+    
+    Args:
+        grid: 64x64 cell states, updated in place
+        region: 2D uint8 region whose non-zero cells are stamped
+        x: Grid column of the region's left edge (may be negative)
+        y: Grid row of the region's top edge (may be negative)
+    """
+    height, width = region.shape
+    src_y, src_x = max(0, -y), max(0, -x)
+    dst_y, dst_x = max(0, y), max(0, x)
+    gh = max(0, min(64 - dst_y, height - src_y))
+    gw = max(0, min(64 - dst_x, width - src_x))
+    if gh and gw:
+        target = grid[dst_y:dst_y + gh, dst_x:dst_x + gw]
+        target[region[src_y:src_y + gh, src_x:src_x + gw] != 0] = 1
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _wrap_pad(grid, padded):
+        """Copy the grid into a 66x66 buffer whose border mirrors the opposite edges"""
+        padded[1:65, 1:65] = grid
+        padded[0, 1:65] = grid[63]
+        padded[65, 1:65] = grid[0]
+        padded[1:65, 0] = grid[:, 63]
+        padded[1:65, 65] = grid[:, 0]
+        padded[0, 0] = grid[63, 63]
+        padded[0, 65] = grid[63, 0]
+        padded[65, 0] = grid[0, 63]
+        padded[65, 65] = grid[0, 0]
+    
+    @njit(cache=True, fastmath=True, nogil=True)
+    def gol_step(grid, new_grid, rgb, padded):
+        """Advance one generation and colorize it in a single fused pass"""
+        # Constant-offset reads on the padded grid let LLVM vectorize the loop
+        _wrap_pad(grid, padded)
+        for y in range(1, 65):
+            for x in range(1, 65):
+                n = (padded[y - 1, x - 1] + padded[y - 1, x] + padded[y - 1, x + 1] +
+                     padded[y, x - 1] + padded[y, x + 1] +
+                     padded[y + 1, x - 1] + padded[y + 1, x] + padded[y + 1, x + 1])
+                alive = padded[y, x]
+                new_grid[y - 1, x - 1] = 1 if (n == 3 or (alive and n == 2)) else 0
+                rgb[y - 1, x - 1, 0] = 0
+                if alive:
+                    rgb[y - 1, x - 1, 1] = min(255, n * 40)
+                    rgb[y - 1, x - 1, 2] = 255 - n * 20
+                else:
+                    rgb[y - 1, x - 1, 1] = 0
+                    rgb[y - 1, x - 1, 2] = 0
+    
+    @njit(cache=True)
+    def stamp_region(grid, region, x, y):
+        """Set the grid cells under the live cells of a region, clipped to the grid"""
+        height, width = region.shape
+        for ry in range(max(0, -y), min(height, 64 - y)):
+            for rx in range(max(0, -x), min(width, 64 - x)):
+                if region[ry, rx]:
+                    grid[y + ry, x + rx] = 1
+else:
+    gol_step = gol_step_numpy
+    stamp_region = stamp_region_numpy
+
+
+def compile_aot() -> None:
+    """Compile the Numba kernels ahead of time into the visual_kernels module"""
+    if not NUMBA_AVAILABLE:
+        raise RuntimeError("Numba is required to compile the visual kernels")
+        
+    from numba.pycc import CC
+    
+    cc = CC("visual_kernels")
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    cc.export("gol_step", "void(u1[:,:], u1[:,:], u1[:,:,:], u1[:,:])")(gol_step.py_func)
+    cc.export("stamp_region", "void(u1[:,:], u1[:,:], i8, i8)")(stamp_region.py_func)
+    cc.compile()
+    logger.info(f"Compiled visual kernels into {cc.output_dir}")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    compile_aot()
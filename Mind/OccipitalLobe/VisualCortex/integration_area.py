@@ -3,7 +3,7 @@ Visual Integration Area - Integrates visual processing
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from Mind.CorpusCallosum.synaptic_pathways import SynapticPathways
 from config import CONFIG
 from .primary_visual_area import PrimaryVisualArea
@@ -11,15 +11,28 @@ from .secondary_visual_area import SecondaryVisualArea
 from .associative_visual_area import AssociativeVisualArea
 from Mind.FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
 import asyncio
+import sys
+from collections import deque
+import numpy as np
 from PIL import Image, ImageDraw
 from .splash_screen import SplashScreenManager
-import random
 
 logger = logging.getLogger(__name__)
 
 # Initialize journaling manager
 journaling_manager = SystemJournelingManager()
 
+# Prefer the ahead-of-time compiled kernels, then Cython, then the JIT/NumPy kernels
+try:
+    from .visual_kernels import gol_step as _gol_step, stamp_region as _stamp_region
+    logger.info("Using AOT compiled visual kernels")
+except ImportError:
+    try:
+        from ._gol import gol_step as _gol_step, stamp_region as _stamp_region
+        logger.info("Using Cython visual kernels")
+    except ImportError:
+        from ._kernels import gol_step as _gol_step, stamp_region as _stamp_region
+
 class IntegrationArea:
     """Integrates visual processing"""
     
@@ -31,9 +44,20 @@ class IntegrationArea:
         self.primary_area = PrimaryVisualArea()
         self.secondary_area = SecondaryVisualArea()
         self.associative_area = AssociativeVisualArea()
-        self.grid = [[0 for _ in range(64)] for _ in range(64)]  # Initialize empty grid
+        self.grid = np.zeros((64, 64), dtype=np.uint8)  # Initialize empty grid
+        self._new_grid = np.zeros((64, 64), dtype=np.uint8)  # Next generation buffer
+        self._rgb = np.zeros((64, 64, 3), dtype=np.uint8)  # Rendered frame buffer
+        self._next_rgb = np.zeros((64, 64, 3), dtype=np.uint8)  # Frame being computed
+        self._padded = np.zeros((66, 66), dtype=np.uint8)  # Wrap-padded scratch grid
+        self._grid_edits = 0  # Bumped on every grid edit so in-flight steps can detect them
+        self._canvas = np.zeros((64, 64, 3), dtype=np.uint8)  # Frame built up by draw_pixels
+        self._sprite_cache: Dict[str, Dict[str, Any]] = {}  # Sprites keyed by interned sprite ID
+        self._cmd_sem = asyncio.Semaphore(16)  # Bounds in-flight display commands
         self.is_running = False
         self.splash_manager = None
+        self._splash_base = None  # Prebuilt associative splash background
+        self._splash_base_arr = None  # Pixel array of the splash background
+        self._basic_splash = None  # Prebuilt primary area fallback splash
         
     async def initialize(self, primary_area=None, associative_area=None):
         """Initialize the visual integration area with primary and associative areas"""
@@ -71,10 +95,27 @@ class IntegrationArea:
             logger.error(f"Failed to initialize splash screen manager: {e}")
             # Not critical, can continue without splash screen
         
+        # Render the static splash images once so animations only stamp changes
+        self._build_splash_images()
+        
         self._initialized = success
         journaling_manager.recordInfo("Visual integration area initialized")
         return success
             
+    def _build_splash_images(self) -> None:
+        """Prebuild the fallback splash backgrounds including their text"""
+        self._splash_base = Image.new("RGB", (64, 64), (0, 0, 32))  # Dark blue background
+        draw = ImageDraw.Draw(self._splash_base)
+        draw.text((15, 20), "PM", fill=(255, 255, 255))
+        draw.text((7, 35), "PENPHIN", fill=(200, 200, 255))
+        draw.text((7, 45), "MIND", fill=(128, 200, 255))
+        self._splash_base_arr = np.array(self._splash_base)
+        
+        self._basic_splash = Image.new("RGB", (64, 64), (0, 0, 32))  # Dark blue background
+        draw = ImageDraw.Draw(self._basic_splash)
+        draw.text((15, 20), "PM", fill=(255, 255, 255))
+        draw.text((5, 35), "PenphinMind", fill=(128, 200, 255))
+            
     async def process_visual(self, visual_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process visual input through all areas"""
         try:
@@ -162,24 +203,24 @@ class IntegrationArea:
                 # Start the loading animation
                 await self.splash_manager.start_loading_animation("Initializing systems...")
                 
-                # Simulate loading steps with progress updates
+                # Simulate loading steps with progress updates, holding each step
+                # for half a second and the final step a moment longer at 100%
                 loading_steps = [
-                    (10, "Loading visual cortex..."),
-                    (25, "Initializing LED matrix..."),
-                    (40, "Connecting components..."),
-                    (60, "Starting synaptic pathways..."),
-                    (80, "Preparing neural networks..."),
-                    (95, "Starting mind processes..."),
-                    (100, "System ready")
+                    (10, "Loading visual cortex...", 0.5),
+                    (25, "Initializing LED matrix...", 0.5),
+                    (40, "Connecting components...", 0.5),
+                    (60, "Starting synaptic pathways...", 0.5),
+                    (80, "Preparing neural networks...", 0.5),
+                    (95, "Starting mind processes...", 0.5),
+                    (100, "System ready", 1.5)
                 ]
                 
-                # Display each loading step with a delay
-                for progress, text in loading_steps:
-                    await self.splash_manager.update_loading_progress(progress, text)
-                    await asyncio.sleep(0.5)  # Show each step for half a second
-                
-                # Wait a moment at 100%
-                await asyncio.sleep(1.0)
+                # Let the splash manager play the whole schedule in one task
+                progress_task = self.splash_manager.schedule_progress(loading_steps)
+                if progress_task:
+                    # stop_loading_animation() may cancel the schedule early;
+                    # that must not propagate as our own cancellation
+                    await asyncio.gather(progress_task, return_exceptions=True)
                 
                 # Stop the animation and show completion screen
                 await self.splash_manager.stop_loading_animation()
@@ -196,30 +237,26 @@ class IntegrationArea:
             try:
                 # If we have an associative area, try to use it for fancy visuals
                 logger.info("Showing splash screen via associative area...")
-                # Create a simple rectangle for now
-                image = Image.new("RGB", (64, 64), (0, 0, 32))  # Dark blue background
-                draw = ImageDraw.Draw(image)
-                
-                # Draw text
-                draw.text((15, 20), "PM", fill=(255, 255, 255))
-                draw.text((7, 35), "PENPHIN", fill=(200, 200, 255))
-                draw.text((7, 45), "MIND", fill=(128, 200, 255))
+                # Start from the prebuilt background so text is not re-rendered
+                arr = self._splash_base_arr.copy()
                 
                 # Use the associative area's display capabilities
                 result = True  # Track if display successful
                 
                 try:
+                    # Sample every rectangle's x, y, w, h, r, g, b in one call
+                    rects = np.random.randint(
+                        [0, 0, 4, 4, 0, 0, 100],
+                        [57, 57, 9, 9, 256, 256, 256],
+                        size=(10, 7)
+                    )
+                    
                     # Show rectangles animation
-                    for i in range(10):
-                        x = random.randint(0, 56)
-                        y = random.randint(0, 56)
-                        w = random.randint(4, 8)
-                        h = random.randint(4, 8)
-                        color = (random.randint(0, 255), random.randint(0, 255), random.randint(100, 255))
-                        draw.rectangle((x, y, x+w, y+h), fill=color)
+                    for x, y, w, h, r, g, b in rects:
+                        arr[y:y + h + 1, x:x + w + 1] = (r, g, b)  # Inclusive like draw.rectangle
                         
                         if hasattr(self.primary_area, 'set_image'):
-                            await self.primary_area.set_image(image)
+                            await self.primary_area.set_image(Image.frombuffer("RGB", (64, 64), arr, "raw", "RGB", 0, 1))
                         await asyncio.sleep(0.2)
                 except Exception as e:
                     logger.error(f"Error in splash animation: {e}")
@@ -234,14 +271,8 @@ class IntegrationArea:
             try:
                 logger.info("Showing basic splash screen via primary area...")
                 
-                # Create a simple splash screen image
-                image = Image.new("RGB", (64, 64), (0, 0, 32))  # Dark blue background
-                draw = ImageDraw.Draw(image)
-                draw.text((15, 20), "PM", fill=(255, 255, 255))
-                draw.text((5, 35), "PenphinMind", fill=(128, 200, 255))
-                
-                # Display directly through primary area
-                result = await self.primary_area.set_image(image)
+                # Display the prebuilt splash directly through primary area
+                result = await self.primary_area.set_image(self._basic_splash)
                 if result:
                     logger.info("Basic splash screen displayed successfully")
                     await asyncio.sleep(2.0)  # Show for 2 seconds
@@ -281,10 +312,38 @@ class IntegrationArea:
             logger.error(f"Error triggering splash event {event_name}: {e}")
             return False
             
+    async def _send_command(self, command_type: str, data: Optional[Dict[str, Any]] = None) -> Any:
+        """Send a display command, bounded by the in-flight command semaphore"""
+        async with self._cmd_sem:
+            if data is None:
+                return await SynapticPathways.send_system_command(command_type=command_type)
+            return await SynapticPathways.send_system_command(command_type=command_type, data=data)
+            
+    async def draw_many(self, commands: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Send several display commands concurrently
+        
+        Args:
+            commands: List of dicts with "command_type" and optional "data"
+            
+        Returns:
+            List of responses in the same order as the commands
+            
+        Raises:
+            RuntimeError: If SynapticPathways cannot send display commands
+        """
+        if not hasattr(SynapticPathways, "send_system_command"):
+            raise RuntimeError("draw_many needs SynapticPathways.send_system_command, which is not available")
+            
+        try:
+            return await asyncio.gather(*(self._send_command(**command) for command in commands))
+        except Exception as e:
+            raise Exception(f"Error sending display commands: {e}")
+            
     async def set_background(self, r: int, g: int, b: int) -> None:
         """Set the LED matrix background color"""
         try:
-            await SynapticPathways.send_system_command(
+            await self._send_command(
                 command_type="set_background",
                 data={"r": r, "g": g, "b": b}
             )
@@ -294,7 +353,7 @@ class IntegrationArea:
     async def clear(self) -> None:
         """Clear the LED matrix"""
         try:
-            await SynapticPathways.send_system_command(
+            await self._send_command(
                 command_type="clear_matrix"
             )
         except Exception as e:
@@ -309,7 +368,7 @@ class IntegrationArea:
         """
         try:
             brightness = max(0, min(100, brightness))
-            await SynapticPathways.send_system_command(
+            await self._send_command(
                 command_type="set_brightness",
                 data={"brightness": brightness}
             )
@@ -328,7 +387,7 @@ class IntegrationArea:
             b: Blue component (0-255)
         """
         try:
-            await SynapticPathways.send_system_command(
+            await self._send_command(
                 command_type="draw_pixel",
                 data={
                     "x": x,
@@ -340,7 +399,31 @@ class IntegrationArea:
             )
         except Exception as e:
             raise Exception(f"Error drawing pixel: {e}")
-            
+    
+    async def draw_pixels(self, coords_rgb: np.ndarray) -> None:
+        """
+        Draw many pixels on the LED matrix in a single frame update
+        
+        The pixels are stamped into the integration area's own 64x64 canvas,
+        which is then pushed to the primary area as one image, so the canvas
+        replaces whatever else is currently on the matrix.
+        
+        Args:
+            coords_rgb: Array of shape (N, 5) with rows of x, y, r, g, b
+        """
+        try:
+            pixels = np.asarray(coords_rgb, dtype=np.int32).reshape(-1, 5)
+            xs, ys = pixels[:, 0], pixels[:, 1]
+            pixels = pixels[(xs >= 0) & (xs < 64) & (ys >= 0) & (ys < 64)]
+            if len(pixels) == 0:
+                return
+            
+            self._canvas[pixels[:, 1], pixels[:, 0]] = np.clip(pixels[:, 2:], 0, 255)
+            image = Image.frombuffer("RGB", (64, 64), self._canvas, "raw", "RGB", 0, 1)
+            await self.primary_area.set_image(image)
+        except Exception as e:
+            raise Exception(f"Error drawing pixels: {e}")
+    
     async def draw_circle(self, x: int, y: int, radius: int, r: int, g: int, b: int) -> None:
         """
         Draw a circle on the LED matrix
@@ -354,7 +437,7 @@ class IntegrationArea:
             b: Blue component (0-255)
         """
         try:
-            await SynapticPathways.send_system_command(
+            await self._send_command(
                 command_type="draw_circle",
                 data={
                     "x": x,
@@ -382,7 +465,7 @@ class IntegrationArea:
             b: Blue component (0-255)
         """
         try:
-            await SynapticPathways.send_system_command(
+            await self._send_command(
                 command_type="draw_line",
                 data={
                     "x1": x1,
@@ -410,7 +493,7 @@ class IntegrationArea:
             b: Blue component (0-255)
         """
         try:
-            await SynapticPathways.send_system_command(
+            await self._send_command(
                 command_type="draw_text",
                 data={
                     "x": x,
@@ -424,6 +507,11 @@ class IntegrationArea:
         except Exception as e:
             raise Exception(f"Error drawing text: {e}")
             
+    @staticmethod
+    def _sprite_key(sprite_id: Any) -> Any:
+        """Intern string sprite IDs so cache lookups compare by identity"""
+        return sys.intern(sprite_id) if isinstance(sprite_id, str) else sprite_id
+            
     async def create_sprite(self, width: int, height: int) -> Dict[str, Any]:
         """
         Create a sprite for animation
@@ -436,7 +524,7 @@ class IntegrationArea:
             Dict containing sprite data and metadata
         """
         try:
-            response = await SynapticPathways.send_system_command(
+            response = await self._send_command(
                 command_type="create_sprite",
                 data={
                     "width": width,
@@ -445,7 +533,7 @@ class IntegrationArea:
             )
             sprite_id = response.get("sprite_id")
             if sprite_id:
-                self._sprite_cache[sprite_id] = response
+                self._sprite_cache[self._sprite_key(sprite_id)] = response
             return response
         except Exception as e:
             raise Exception(f"Error creating sprite: {e}")
@@ -460,10 +548,11 @@ class IntegrationArea:
             y: Y coordinate
         """
         try:
+            sprite_id = self._sprite_key(sprite_id)
             if sprite_id not in self._sprite_cache:
                 raise Exception(f"Sprite {sprite_id} not found")
                 
-            await SynapticPathways.send_system_command(
+            await self._send_command(
                 command_type="draw_sprite",
                 data={
                     "sprite_id": sprite_id,
@@ -483,10 +572,11 @@ class IntegrationArea:
             frame_data: New frame data
         """
         try:
+            sprite_id = self._sprite_key(sprite_id)
             if sprite_id not in self._sprite_cache:
                 raise Exception(f"Sprite {sprite_id} not found")
                 
-            await SynapticPathways.send_system_command(
+            await self._send_command(
                 command_type="update_sprite",
                 data={
                     "sprite_id": sprite_id,
@@ -504,8 +594,9 @@ class IntegrationArea:
             sprite_id: ID of the sprite to delete
         """
         try:
+            sprite_id = self._sprite_key(sprite_id)
             if sprite_id in self._sprite_cache:
-                await SynapticPathways.send_system_command(
+                await self._send_command(
                     command_type="delete_sprite",
                     data={"sprite_id": sprite_id}
                 )
@@ -522,10 +613,11 @@ class IntegrationArea:
             fps: Optional frames per second (defaults to config)
         """
         try:
+            sprite_id = self._sprite_key(sprite_id)
             if sprite_id not in self._sprite_cache:
                 raise Exception(f"Sprite {sprite_id} not found")
                 
-            await SynapticPathways.send_system_command(
+            await self._send_command(
                 command_type="start_animation",
                 data={
                     "sprite_id": sprite_id,
@@ -543,10 +635,11 @@ class IntegrationArea:
             sprite_id: ID of the sprite to stop
         """
         try:
+            sprite_id = self._sprite_key(sprite_id)
             if sprite_id not in self._sprite_cache:
                 raise Exception(f"Sprite {sprite_id} not found")
                 
-            await SynapticPathways.send_system_command(
+            await self._send_command(
                 command_type="stop_animation",
                 data={"sprite_id": sprite_id}
             )
@@ -556,11 +649,11 @@ class IntegrationArea:
     async def process_visual_input(self, image_data: bytes) -> Dict[str, Any]:
         """Process visual input data"""
         try:
-            # Process basic features
-            basic_features = await self.primary_area.process_raw_visual(image_data)
-            
-            # Process complex features
-            complex_features = await self.secondary_area.analyze_complex_features(image_data)
+            # Basic and complex features are independent, so process them concurrently
+            basic_features, complex_features = await asyncio.gather(
+                self.primary_area.process_raw_visual(image_data),
+                self.secondary_area.analyze_complex_features(image_data)
+            )
             
             return {
                 "basic_features": basic_features,
@@ -590,11 +683,15 @@ class IntegrationArea:
             y: Y coordinate (0-63)
             state: Cell state (0 or 1)
         """
-        journaling_manager.recordScope("[Visual Cortex] update_cell", x=x, y=y, state=state)
+        debug = journaling_manager.isDebugEnabled()
+        if debug:
+            journaling_manager.recordScope("[Visual Cortex] update_cell", x=x, y=y, state=state)
         try:
             if 0 <= x < 64 and 0 <= y < 64 and state in (0, 1):
-                self.grid[y][x] = state
-                journaling_manager.recordDebug(f"Updated cell at ({x}, {y}) to {state}")
+                self.grid[y, x] = state
+                self._grid_edits += 1
+                if debug:
+                    journaling_manager.recordDebug(f"Updated cell at ({x}, {y}) to {state}")
             else:
                 journaling_manager.recordError(f"Invalid cell update parameters: x={x}, y={y}, state={state}")
                 
@@ -602,7 +699,7 @@ class IntegrationArea:
             journaling_manager.recordError(f"Error updating cell: {e}")
             raise
 
-    async def update_region(self, x: int, y: int, region: list[list[int]]) -> None:
+    async def update_region(self, x: int, y: int, region: list[list[int]], masked: bool = False) -> None:
         """
         Update a rectangular region of the grid
         
@@ -610,20 +707,34 @@ class IntegrationArea:
             x: Starting X coordinate
             y: Starting Y coordinate
             region: 2D list of cell states (0s and 1s)
+            masked: If True, only stamp live cells and leave the rest of the grid untouched
         """
-        journaling_manager.recordScope("[Visual Cortex] update_region", x=x, y=y, region_size=f"{len(region)}x{len(region[0])}")
+        debug = journaling_manager.isDebugEnabled()
+        if debug:
+            journaling_manager.recordScope("[Visual Cortex] update_region", x=x, y=y, region_size=f"{len(region)}x{len(region[0]) if len(region) else 0}")
         try:
-            height = len(region)
-            width = len(region[0])
-            
-            for dy in range(height):
-                for dx in range(width):
-                    grid_x = x + dx
-                    grid_y = y + dy
-                    if 0 <= grid_x < 64 and 0 <= grid_y < 64:
-                        self.grid[grid_y][grid_x] = region[dy][dx]
+            region_arr = np.ascontiguousarray(region, dtype=np.uint8)
+            if region_arr.size == 0:
+                if debug:
+                    journaling_manager.recordDebug(f"Ignoring empty region update at ({x}, {y})")
+                return
+                
+            height, width = region_arr.shape
+            
+            if masked:
+                _stamp_region(self.grid, region_arr, x, y)
+            else:
+                # Clip the region against the grid once instead of per cell
+                src_y, src_x = max(0, -y), max(0, -x)
+                dst_y, dst_x = max(0, y), max(0, x)
+                gh = max(0, min(64 - dst_y, height - src_y))
+                gw = max(0, min(64 - dst_x, width - src_x))
+                if gh and gw:
+                    self.grid[dst_y:dst_y + gh, dst_x:dst_x + gw] = region_arr[src_y:src_y + gh, src_x:src_x + gw]
+            self._grid_edits += 1
                         
-            journaling_manager.recordDebug(f"Updated region at ({x}, {y}) with size {width}x{height}")
+            if debug:
+                journaling_manager.recordDebug(f"Updated region at ({x}, {y}) with size {width}x{height}")
             
         except Exception as e:
             journaling_manager.recordError(f"Error updating region: {e}")
@@ -638,8 +749,10 @@ class IntegrationArea:
         """
         journaling_manager.recordScope("[Visual Cortex] set_grid")
         try:
-            if len(new_grid) == 64 and all(len(row) == 64 for row in new_grid):
-                self.grid = [row[:] for row in new_grid]  # Deep copy
+            grid_arr = np.asarray(new_grid, dtype=np.uint8)
+            if grid_arr.shape == (64, 64):
+                self.grid[:] = grid_arr
+                self._grid_edits += 1
                 journaling_manager.recordDebug("Grid replaced successfully")
             else:
                 journaling_manager.recordError("Invalid grid dimensions")
@@ -654,44 +767,46 @@ class IntegrationArea:
         journaling_manager.recordScope("[Visual Cortex] run_game_of_life")
         try:
             self.is_running = True
+            last_frame_hash = None
+            recent_frame_hashes = deque(maxlen=8)  # Detects still lifes and short oscillators
+            
+            # Compute the first frame; later steps overlap with displaying the previous one
+            edits = self._grid_edits
+            await self._finish_step(
+                asyncio.to_thread(_gol_step, self.grid, self._new_grid, self._rgb, self._padded),
+                edits, self._rgb
+            )
+            self.grid, self._new_grid = self._new_grid, self.grid
+            
             while self.is_running:
-                # Create image from current grid state
-                image = Image.new("RGB", (64, 64))
-                pixels = image.load()
-                
-                for y in range(64):
-                    for x in range(64):
-                        if self.grid[y][x]:
-                            # Calculate neighbors for color
-                            neighbors = sum(
-                                self.grid[(y + dy) % 64][(x + dx) % 64]
-                                for dy in [-1, 0, 1]
-                                for dx in [-1, 0, 1]
-                                if not (dx == 0 and dy == 0)
-                            )
-                            color = (0, min(255, neighbors * 40), 255 - neighbors * 20)
-                            pixels[x, y] = color
+                # Start computing the next generation off the event loop (the kernel releases the GIL)
+                edits = self._grid_edits
+                next_step = asyncio.create_task(asyncio.to_thread(
+                    _gol_step, self.grid, self._new_grid, self._next_rgb, self._padded
+                ))
                 
-                # Display current state
-                await self.primary_area.set_image(image)
+                try:
+                    # Only send frames that differ from what is already displayed
+                    frame_hash = hash(self._rgb.tobytes())
+                    if frame_hash != last_frame_hash:
+                        # Wrap the frame buffer directly rather than going through fromarray
+                        image = Image.frombuffer("RGB", (64, 64), self._rgb, "raw", "RGB", 0, 1)
+                        await self.primary_area.set_image(image)
+                        last_frame_hash = frame_hash
+                except BaseException:
+                    # Don't leave the worker writing into the buffers after we stop
+                    await asyncio.gather(next_step, return_exceptions=True)
+                    raise
                 
-                # Update grid for next generation
-                new_grid = [[0]*64 for _ in range(64)]
-                for y in range(64):
-                    for x in range(64):
-                        neighbors = sum(
-                            self.grid[(y + dy) % 64][(x + dx) % 64]
-                            for dy in [-1, 0, 1]
-                            for dx in [-1, 0, 1]
-                            if not (dx == 0 and dy == 0)
-                        )
-                        if self.grid[y][x]:
-                            new_grid[y][x] = 1 if neighbors in [2, 3] else 0
-                        else:
-                            new_grid[y][x] = 1 if neighbors == 3 else 0
+                # Swap buffers once the next generation is ready
+                await self._finish_step(next_step, edits, self._next_rgb)
+                self.grid, self._new_grid = self._new_grid, self.grid
+                self._rgb, self._next_rgb = self._next_rgb, self._rgb
                 
-                self.grid = new_grid
-                await asyncio.sleep(0.1)
+                # Slow down once the board has settled into a repeating pattern
+                settled = frame_hash in recent_frame_hashes
+                recent_frame_hashes.append(frame_hash)
+                await asyncio.sleep(0.5 if settled else 0.1)
                 
         except Exception as e:
             journaling_manager.recordError(f"Error in game of life: {e}")
@@ -700,6 +815,21 @@ class IntegrationArea:
             self.is_running = False
             await self.primary_area.clear()
 
+    async def _finish_step(self, step, edits: int, rgb: np.ndarray) -> None:
+        """
+        Wait for a Game of Life step, redoing it if the grid was edited meanwhile
+        
+        Args:
+            step: Awaitable running the step on a worker thread
+            edits: Grid edit counter when the step started
+            rgb: Frame buffer the step renders into
+        """
+        await step
+        while self._grid_edits != edits:
+            # The step read a grid that was changing under it; recompute from the edited grid
+            edits = self._grid_edits
+            await asyncio.to_thread(_gol_step, self.grid, self._new_grid, rgb, self._padded)
+            
     async def stop_game(self) -> None:
         """Stop the Game of Life simulation"""
         journaling_manager.recordScope("[Visual Cortex] stop_game")
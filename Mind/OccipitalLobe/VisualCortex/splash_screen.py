@@ -36,6 +36,7 @@ class SplashScreenManager:
         self._loading_text = "Starting..."
         self._running = False
         self._task = None
+        self._progress_task = None
         self._completed_events = set()
         self._current_step = 0
         
@@ -348,6 +349,36 @@ class SplashScreenManager:
         if text:
             self._loading_text = text
             
+    def schedule_progress(self, steps):
+        """
+        Play a whole loading progress schedule from a single background task.
+        
+        Args:
+            steps: List of (progress, text, hold_seconds) tuples shown in order
+            
+        Returns:
+            asyncio.Task: Task that finishes once the last step has been held,
+            or None if the loading animation is not running
+        """
+        if not self._enabled or not self._running:
+            return None
+            
+        if self._progress_task and not self._progress_task.done():
+            self._progress_task.cancel()
+            
+        self._progress_task = asyncio.create_task(self._run_progress_schedule(steps))
+        return self._progress_task
+        
+    async def _run_progress_schedule(self, steps):
+        """Background task that walks through a progress schedule."""
+        for progress, text, hold in steps:
+            if not self._running:
+                break
+            self._loading_progress = min(100, max(0, progress))
+            if text:
+                self._loading_text = text
+            await asyncio.sleep(hold)
+            
     async def stop_loading_animation(self):
         """Stop the loading animation and clean up."""
         if not self._running:
@@ -355,6 +386,10 @@ class SplashScreenManager:
             
         self._running = False
         
+        if self._progress_task and not self._progress_task.done():
+            self._progress_task.cancel()
+        self._progress_task = None
+        
         if self._task and not self._task.done():
             # Wait for the task to finish
             try:
@@ -122,12 +122,10 @@ class AudioCommand(BaseCommand):
     """Base class for all audio-related commands"""
     
     def __init__(self, action: str, data: Dict[str, Any] = None, request_id: str = None):
-        super().__init__(
-            command_type=CommandType.AUDIO,
-            action=action,
-            data=data or {},
-            request_id=request_id or f"audio_{int(time.time())}"
-        )
+        super().__init__(request_id or f"audio_{int(time.time())}")
+        self.work_id = CommandType.AUDIO.value
+        self.action = action
+        self.data = data or {}
 
     @classmethod
     def create_tts_command(cls, text: str, voice: str = "default", 
@@ -156,15 +154,16 @@ class AudioCommand(BaseCommand):
     @classmethod
     def create_vad_command(cls, audio_chunk: bytes = b'',
                           threshold: float = 0.5,
-                          frame_duration: int = 30) -> 'AudioCommand':
-        return cls(
-            action="vad",
-            data={
-                "audio_chunk": audio_chunk,
-                "threshold": threshold,
-                "frame_duration": frame_duration
-            }
-        )
+                          frame_duration: int = 30,
+                          frame_samples: Optional[int] = None) -> 'AudioCommand':
+        data = {
+            "audio_chunk": audio_chunk,
+            "threshold": threshold,
+            "frame_duration": frame_duration
+        }
+        if frame_samples is not None:
+            data["frame_samples"] = frame_samples
+        return cls(action="vad", data=data)
     
     @classmethod
     def create_whisper_command(cls, audio_data: bytes,
@@ -11,17 +11,22 @@ Project Function:
     - Direct audio playback
 """
 
+import asyncio
+import io
 import logging
-from typing import Dict, Any, Optional
+import functools
+import math
+from typing import Dict, Any, Optional, Iterable
 import numpy as np
 import subprocess
-from pathlib import Path
+import tempfile
 from ....CorpusCallosum.synaptic_pathways import SynapticPathways
 from ....Subcortex.api_commands import (
     CommandType,
     AudioCommand,
     BaseCommand
 )
+from ....Subcortex.neurocortical_bridge import NeurocorticalBridge
 from config import CONFIG, AudioOutputType
 import platform
 from ....FrontalLobe.PrefrontalCortex.system_journeling_manager import SystemJournelingManager
@@ -31,6 +36,47 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Keep one-shot playback files in RAM when tmpfs is available
+_TEMP_AUDIO_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Close the aplay pipe after this long without playback so other players can open the card
+_APLAY_IDLE_SECONDS = 5.0
+
+# WaveShare HAT mixer controls driven by configure_audio_device and set_volume
+_VOL_CONTROLS = ("Speaker", "Playback", "Headphone", "PCM")
+
+# VAD ring buffer size; a power of two so positions wrap with a mask
+_RING_SIZE = 1 << 16
+_RING_MASK = _RING_SIZE - 1
+
+# Speech must carry this many times the tracked noise floor energy (about 6 dB)
+_NOISE_MARGIN = 4.0
+_NOISE_FLOOR_ALPHA = 0.05
+
+# Use Numba for the energy gate if available, otherwise fall back to NumPy
+try:
+    from numba import njit
+    
+    @njit(cache=True, fastmath=True)
+    def _short_time_energy(samples: np.ndarray) -> float:
+        """Mean squared amplitude of 16-bit PCM samples"""
+        if samples.size == 0:
+            return 0.0
+        total = 0.0
+        for i in range(samples.size):
+            value = float(samples[i])
+            total += value * value
+        return total / samples.size
+except ImportError:
+    logger.info("Numba not available, using NumPy energy gate")
+    
+    def _short_time_energy(samples: np.ndarray) -> float:
+        """Mean squared amplitude of 16-bit PCM samples"""
+        if samples.size == 0:
+            return 0.0
+        values = samples.astype(np.float32)
+        return float(np.dot(values, values)) / samples.size
+
 # Initialize journaling manager
 journaling_manager = SystemJournelingManager()
 
@@ -38,19 +84,103 @@ class AcousticProcessingError(Exception):
     """Acoustic processing related errors"""
     pass
 
+@functools.lru_cache(maxsize=1)
+def _is_raspberry_pi() -> bool:
+    """Check if running on a Raspberry Pi (the hardware cannot change, so read cpuinfo once)"""
+    try:
+        # The Model line follows a few short per-core blocks, well inside 4 KB
+        with open('/proc/cpuinfo', 'rb') as f:
+            return b'Raspberry Pi' in f.read(4096)
+    except OSError:
+        return False
+
+def _vad_frame_samples(sample_rate: int) -> int:
+    """Power-of-two sample count closest to a 16 ms frame, so frames feed a radix-2 FFT"""
+    return 1 << int(round(math.log2(sample_rate * 0.016)))
+
+async def _run_checked(*args: str, input: Optional[bytes] = None) -> None:
+    """
+    Run a command without blocking the event loop
+    
+    Args:
+        args: Program and arguments
+        input: Bytes to write to the program's stdin
+        
+    Raises:
+        subprocess.CalledProcessError: If the program exits with a non-zero status
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate(input)
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, args, stdout, stderr)
+
+async def _amixer_set_volume(controls: Iterable[str], volume: int) -> None:
+    """
+    Set several mixer controls on card 0 with a single amixer process
+    
+    Args:
+        controls: Mixer control names
+        volume: Volume level (0-100)
+    """
+    # amixer -s reads one command per line from stdin, saving a fork+exec per control
+    level = f' {volume}%\n'
+    await _run_checked(
+        'amixer', '-c', '0', '-s',
+        input=''.join('sset ' + control + level for control in controls).encode()
+    )
+
+def _normalize_pcm(audio_data: bytes) -> bytes:
+    """
+    Scale 16-bit PCM so its peak reaches full scale
+    
+    Args:
+        audio_data: Raw 16-bit PCM
+        
+    Returns:
+        bytes: Normalized PCM (silence is returned unchanged)
+    """
+    samples = np.frombuffer(audio_data, dtype=np.int16, count=len(audio_data) // 2)
+    peak = int(np.abs(samples.astype(np.int32)).max()) if samples.size else 0
+    if peak == 0:
+        return bytes(audio_data)
+    scaled = np.rint(samples * np.float32(32767.0 / peak))
+    return np.clip(scaled, -32768, 32767).astype(np.int16).tobytes()
+
 class PrimaryAcousticArea:
     """Maps to AudioManager's core device functionality"""
     
+    # Fixed attribute set: no per-instance __dict__ on the memory-constrained Pi
+    __slots__ = (
+        '_initialized', '_processing', 'frequency_range', 'audio_device',
+        'vad_active', 'current_stream', '_stream_w', '_aplay', '_aplay_idle', '_frame_samples',
+        '_fft_window', '_noise_floor', '_ring', '_ring_w', '_ring_r', '_last_analysis'
+    )
+    
     def __init__(self):
         """Initialize the primary acoustic area"""
         journaling_manager.recordScope("PrimaryAcousticArea.__init__")
         self._initialized = False
         self._processing = False
-        self.logger = logging.getLogger(__name__)
         self.frequency_range = (20, 20000)  # Human auditory range in Hz
         self.audio_device = None
         self.vad_active: bool = False
-        self.current_stream: Optional[bytes] = None
+        self.current_stream: Optional[bytearray] = None
+        self._stream_w = 0
+        self._aplay: Optional[subprocess.Popen] = None
+        self._aplay_idle: Optional[asyncio.Task] = None
+        self._frame_samples = _vad_frame_samples(CONFIG.sample_rate)
+        self._fft_window = np.hanning(self._frame_samples).astype(np.float32)
+        # Start the floor where its margin equals the configured minimum, so that applies at once
+        self._noise_floor = float(CONFIG.vad_energy_threshold) ** 2 / _NOISE_MARGIN
+        self._ring = bytearray(_RING_SIZE)
+        self._ring_w = 0
+        self._ring_r = 0
+        self._last_analysis: Optional[tuple] = None
         
     async def initialize(self) -> None:
         """Initialize the primary acoustic area"""
@@ -75,15 +205,11 @@ class PrimaryAcousticArea:
         """Configure audio device"""
         try:
             # Check if we're on Raspberry Pi
-            is_raspberry_pi = self._is_raspberry_pi()
+            is_raspberry_pi = _is_raspberry_pi()
             
             if is_raspberry_pi:
                 # Use WaveShare audio HAT implementation
-                for control in CONFIG.audio_device_controls:
-                    subprocess.run(
-                        ["amixer", "-c", "0", "sset", control, f"{CONFIG.audio_device_controls['volume']}%"],
-                        check=True
-                    )
+                await _amixer_set_volume(_VOL_CONTROLS, CONFIG.audio_device_controls['volume'])
                 journaling_manager.recordInfo("WaveShare audio HAT configured")
             else:
                 # Use LLM audio output for non-Raspberry Pi platforms
@@ -94,14 +220,90 @@ class PrimaryAcousticArea:
             journaling_manager.recordError(f"Failed to configure audio device: {e}")
             raise
             
-    def _is_raspberry_pi(self) -> bool:
-        """Check if running on a Raspberry Pi"""
+    def _open_playback_pipe(self) -> bool:
+        """
+        Start a long-lived aplay that plays raw PCM written to its stdin
+        
+        Returns:
+            bool: True if the pipe is open
+        """
+        if self._aplay is not None and self._aplay.poll() is None:
+            return True
+            
+        # Buffer one 10 ms chunk of 16-bit PCM so each flush is a single write
+        chunk_bytes = CONFIG.sample_rate * CONFIG.channels * 2 // 100
         try:
-            with open('/proc/cpuinfo', 'r') as f:
-                return 'Raspberry Pi' in f.read()
-        except:
+            self._aplay = subprocess.Popen(
+                ['aplay', '-q', '-D', CONFIG.audio_device_name, '-t', 'raw', '-f', 'S16_LE',
+                 '-r', str(CONFIG.sample_rate), '-c', str(CONFIG.channels)],
+                stdin=subprocess.PIPE,
+                bufsize=chunk_bytes
+            )
+            journaling_manager.recordInfo("Persistent aplay pipe opened")
+            return True
+        except OSError as e:
+            self._aplay = None
+            journaling_manager.recordError(f"Could not open aplay pipe, using file playback: {e}")
             return False
             
+    async def _close_playback_pipe(self) -> None:
+        """Close the aplay pipe and wait for it to play out, releasing the sound card"""
+        await self._stop_idle_close()
+        if self._aplay is None:
+            return
+            
+        # Closing stdin lets aplay play out what it has buffered and exit
+        aplay, self._aplay = self._aplay, None
+        try:
+            aplay.stdin.close()
+        except BrokenPipeError:
+            pass
+        await asyncio.to_thread(aplay.wait)
+        
+    async def _stop_idle_close(self) -> None:
+        """Cancel a pending idle close, or let one already closing the pipe finish"""
+        idle, self._aplay_idle = self._aplay_idle, None
+        if idle is None or idle is asyncio.current_task():
+            return
+        if self._aplay is None:
+            # The idle close has taken the pipe; wait until aplay has released the card
+            await idle
+        else:
+            idle.cancel()
+        
+    async def _close_playback_pipe_when_idle(self) -> None:
+        """Close the aplay pipe once no playback has arrived for a while"""
+        await asyncio.sleep(_APLAY_IDLE_SECONDS)
+        await self._close_playback_pipe()
+            
+    def _pipe_payload(self, audio_data: bytes) -> Optional[bytes]:
+        """
+        Get the PCM to write to the playback pipe
+        
+        Args:
+            audio_data: WAV file contents or raw PCM in the configured format
+            
+        Returns:
+            Optional[bytes]: PCM frames, or None if the pipe cannot play this audio
+        """
+        if not audio_data.startswith(b'RIFF'):
+            return audio_data
+            
+        try:
+            with wave.open(io.BytesIO(audio_data), 'rb') as wav:
+                if (wav.getsampwidth() != 2 or wav.getnchannels() != CONFIG.channels
+                        or wav.getframerate() != CONFIG.sample_rate):
+                    return None
+                return wav.readframes(wav.getnframes())
+        except (wave.Error, EOFError):
+            # Float or truncated WAVs are left for aplay to parse from a file
+            return None
+            
+    def _write_playback(self, pcm: bytes) -> None:
+        """Write PCM to the aplay pipe (blocks while aplay drains it)"""
+        self._aplay.stdin.write(pcm)
+        self._aplay.stdin.flush()
+            
     async def start_vad(self) -> None:
         """Start Voice Activity Detection"""
         if self.vad_active:
@@ -109,15 +311,9 @@ class PrimaryAcousticArea:
             
         try:
             self.vad_active = True
+            self._ring_w = self._ring_r = 0
             
-            # Use NeurocorticalBridge instead of direct SynapticPathways call
-            from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
-            
-            command = AudioCommand.create_vad_command(
-                audio_chunk=b'',  # Initial empty chunk
-                threshold=0.5,
-                frame_duration=30
-            )
+            command = self._vad_command(b'')  # Initial empty chunk
             await NeurocorticalBridge.execute(command)
             journaling_manager.recordInfo("VAD started")
         except Exception as e:
@@ -125,9 +321,53 @@ class PrimaryAcousticArea:
             self.vad_active = False
             raise
             
-    async def initiate_voice_detection(self) -> None:
-        """Start Voice Activity Detection (alias for start_vad)"""
-        return await self.start_vad()
+    def _vad_command(self, audio_chunk: bytes) -> AudioCommand:
+        """Build a VAD command for whole power-of-two frames"""
+        return AudioCommand.create_vad_command(
+            audio_chunk=memoryview(audio_chunk),
+            threshold=0.5,
+            frame_duration=round(1000 * self._frame_samples / CONFIG.sample_rate),
+            frame_samples=self._frame_samples
+        )
+        
+    def _ring_write(self, data: memoryview) -> None:
+        """Copy data into the ring buffer (caller guarantees it fits)"""
+        start = self._ring_w & _RING_MASK
+        first = min(len(data), _RING_SIZE - start)
+        self._ring[start:start + first] = data[:first]
+        self._ring[:len(data) - first] = data[first:]
+        self._ring_w += len(data)
+        
+    def _ring_read(self, size: int) -> bytes:
+        """Take size bytes out of the ring buffer"""
+        start = self._ring_r & _RING_MASK
+        first = min(size, _RING_SIZE - start)
+        # Join views of the one or two spans: a single allocation, no intermediate copies
+        with memoryview(self._ring) as ring:
+            data = b''.join((ring[start:start + first], ring[:size - first]))
+        self._ring_r += size
+        return data
+        
+    async def _feed_vad(self, chunk: bytes) -> None:
+        """
+        Buffer a chunk for VAD and dispatch every run of whole frames as one command
+        
+        Args:
+            chunk: Raw 16-bit PCM of any length
+        """
+        frame_bytes = self._frame_samples * 2
+        view = memoryview(chunk).cast('B')
+        while view:
+            part = view[:_RING_SIZE - (self._ring_w - self._ring_r)]
+            self._ring_write(part)
+            view = view[len(part):]
+            
+            available = self._ring_w - self._ring_r
+            if available >= frame_bytes:
+                block = self._ring_read(available - available % frame_bytes)
+                await NeurocorticalBridge.execute(self._vad_command(block))
+                
+    initiate_voice_detection = start_vad
             
     async def stop_vad(self) -> None:
         """Stop Voice Activity Detection"""
@@ -137,9 +377,7 @@ class PrimaryAcousticArea:
         self.vad_active = False
         journaling_manager.recordInfo("VAD stopped")
         
-    async def terminate_voice_detection(self) -> None:
-        """Stop Voice Activity Detection (alias for stop_vad)"""
-        return await self.stop_vad()
+    terminate_voice_detection = stop_vad
         
     async def process_acoustic_signal(self, audio_data: bytes, operation: str = "normalize") -> bytes:
         """
@@ -153,20 +391,21 @@ class PrimaryAcousticArea:
             bytes: Processed acoustic data
         """
         try:
-            # Use NeurocorticalBridge instead of direct SynapticPathways call
-            from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
-            
+            # Peak normalization is one vectorized pass, so keep it in process
+            if operation == "normalize":
+                return _normalize_pcm(audio_data)
+                
             command = AudioCommand(
                 action=operation,
                 data={
-                    "audio_data": audio_data,
-                    "sample_rate": CONFIG.audio_sample_rate,
-                    "channels": CONFIG.audio_channels
+                    "audio_data": memoryview(audio_data),
+                    "sample_rate": CONFIG.sample_rate,
+                    "channels": CONFIG.channels
                 }
             )
             response = await NeurocorticalBridge.execute(command)
             return response.get("processed_audio", b'')
-        except Exception as e:
+        except (AcousticProcessingError, OSError, asyncio.TimeoutError) as e:
             journaling_manager.recordError(f"Acoustic processing error: {e}")
             return audio_data
             
@@ -174,40 +413,46 @@ class PrimaryAcousticArea:
         """
         Play audio data through the system
         
+        Audio in the configured PCM format is written to a persistent aplay pipe,
+        opened on first use and closed after a few idle seconds. In that case this
+        returns once the PCM has been written to the pipe, not when it has finished
+        playing. Other audio is played from a file and returns when playback ends.
+        
         Args:
             audio_data: Audio data to play
         """
         try:
-            # Use WaveShare audio system by default
-            # Save audio data to temporary file
-            temp_file = Path("temp_audio.wav")
-            temp_file.write_bytes(audio_data)
-            
-            try:
+            pcm = self._pipe_payload(audio_data)
+            await self._stop_idle_close()
+            if pcm is not None and self._open_playback_pipe():
+                # Stream into the long-lived aplay: no temp file and no process start per call
+                await asyncio.to_thread(self._write_playback, pcm)
+                self._aplay_idle = asyncio.create_task(self._close_playback_pipe_when_idle())
+                return
+                
+            # The card has a single playback substream, so release it before the one-shot aplay
+            await self._close_playback_pipe()
+            
+            # Fall back to a one-shot aplay of a temporary file
+            with tempfile.NamedTemporaryFile(suffix='.wav', dir=_TEMP_AUDIO_DIR) as temp_file:
+                # Write straight from the caller's buffer without an intermediate copy
+                view = memoryview(audio_data)
+                while view:
+                    view = view[os.write(temp_file.fileno(), view):]
+                    
                 # Play using aplay
-                subprocess.run(
-                    ['aplay', '-D', CONFIG.audio_device_name, str(temp_file)],
-                    check=True,
-                    capture_output=True
-                )
-            finally:
-                # Cleanup temp file
-                if temp_file.exists():
-                    temp_file.unlink()
+                await _run_checked('aplay', '-D', CONFIG.audio_device_name, temp_file.name)
                     
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, BrokenPipeError) as e:
             journaling_manager.recordError(f"WaveShare playback error: {e}")
             raise AcousticProcessingError(f"Failed to play audio: {e}")
-        except Exception as e:
+        except OSError as e:
             journaling_manager.recordError(f"Audio playback error: {e}")
             raise AcousticProcessingError(f"Failed to play audio: {e}")
             
     async def text_to_speech(self, text: str) -> bytes:
         """Convert text to speech using configured TTS implementation"""
         try:
-            # Use NeurocorticalBridge instead of direct SynapticPathways call
-            from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
-            
             command = AudioCommand.create_tts_command(
                 text=text,
                 voice=CONFIG.elevenlabs_voice_id if CONFIG.tts_implementation == "elevenlabs" else "default",
@@ -216,7 +461,7 @@ class PrimaryAcousticArea:
             )
             response = await NeurocorticalBridge.execute(command)
             return response.get("audio_data", b'')
-        except Exception as e:
+        except (AcousticProcessingError, OSError, asyncio.TimeoutError) as e:
             journaling_manager.recordError(f"TTS error: {e}")
             raise AcousticProcessingError(f"Failed to convert text to speech: {e}")
             
@@ -231,20 +476,36 @@ class PrimaryAcousticArea:
             str: Transcribed text
         """
         try:
-            # Use NeurocorticalBridge instead of direct SynapticPathways call
-            from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
-            
             command = AudioCommand.create_asr_command(
-                audio_data=audio_data, 
+                audio_data=memoryview(audio_data), 
                 language="en"
             )
             
             response = await NeurocorticalBridge.execute(command)
             return response.get("text", "")
-        except Exception as e:
+        except (AcousticProcessingError, OSError, asyncio.TimeoutError) as e:
             journaling_manager.recordError(f"ASR error: {e}")
             raise AcousticProcessingError(f"Failed to convert speech to text: {e}")
             
+    def _has_voice_energy(self, audio_data: bytes) -> bool:
+        """
+        Energy pre-gate: check a chunk stands out from the background noise
+        
+        Args:
+            audio_data: Raw 16-bit PCM
+            
+        Returns:
+            bool: True if the chunk may contain speech
+        """
+        energy = _short_time_energy(np.frombuffer(audio_data, dtype=np.int16, count=len(audio_data) // 2))
+        threshold = max(float(CONFIG.vad_energy_threshold) ** 2, self._noise_floor * _NOISE_MARGIN)
+        if energy > threshold:
+            return True
+            
+        # Track the noise floor only on silent chunks so speech does not raise it
+        self._noise_floor += _NOISE_FLOOR_ALPHA * (energy - self._noise_floor)
+        return False
+        
     async def detect_wake_word(self, audio_data: bytes) -> bool:
         """
         Detect wake word using configured KWS provider
@@ -256,25 +517,24 @@ class PrimaryAcousticArea:
             bool: True if wake word detected
         """
         try:
-            # Use NeurocorticalBridge instead of direct SynapticPathways call
-            from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
-            
+            # Silent chunks cannot contain the wake word, so skip the bridge
+            if not self._has_voice_energy(audio_data):
+                return False
+                
             command = AudioCommand.create_kws_command(
-                audio_data=audio_data,
+                audio_data=memoryview(audio_data),
                 wake_word=CONFIG.wake_word
             )
             
             response = await NeurocorticalBridge.execute(command)
             return response.get("wake_word_detected", False)
-        except Exception as e:
+        except (AcousticProcessingError, OSError, asyncio.TimeoutError) as e:
             journaling_manager.recordError(f"KWS error: {e}")
             return False
             
-    async def transmit_acoustic_signal(self, audio_data: bytes) -> None:
-        """Transmit acoustic signal through the system (alias for play_sound)"""
-        return await self.play_sound(audio_data)
+    transmit_acoustic_signal = play_sound
             
-    def set_volume(self, volume: int) -> None:
+    async def set_volume(self, volume: int) -> None:
         """
         Set audio volume
         
@@ -285,29 +545,29 @@ class PrimaryAcousticArea:
         
         if CONFIG.audio_output_type == AudioOutputType.WAVESHARE:
             try:
-                for control in ["Speaker", "Playback", "Headphone", "PCM"]:
-                    subprocess.run(
-                        ['amixer', '-c', '0', 'sset', control, f'{volume}%'],
-                        check=True,
-                        capture_output=True
-                    )
+                await _amixer_set_volume(_VOL_CONTROLS, volume)
                 journaling_manager.recordInfo(f"WaveShare volume set to {volume}%")
-            except subprocess.CalledProcessError as e:
+            except (subprocess.CalledProcessError, OSError) as e:
+                # OSError covers hosts without amixer at all
                 journaling_manager.recordError(f"Error setting WaveShare volume: {e}")
                 raise AcousticProcessingError(f"Failed to set volume: {e}")
                 
-    def adjust_sensitivity(self, sensitivity: int) -> None:
-        """Adjust acoustic sensitivity (alias for set_volume)"""
-        return self.set_volume(sensitivity)
+    adjust_sensitivity = set_volume
             
-    async def start_stream(self) -> None:
-        """Start audio streaming"""
-        self.current_stream = b''
+    async def start_stream(self, expected_seconds: Optional[float] = None) -> None:
+        """
+        Start audio streaming
+        
+        Args:
+            expected_seconds: Expected stream length, used to preallocate the buffer
+        """
+        # Preallocate 16-bit PCM for the expected duration so appends never reallocate
+        size = int(expected_seconds * CONFIG.sample_rate * CONFIG.channels * 2) if expected_seconds else 0
+        self.current_stream = bytearray(size)
+        self._stream_w = 0
         journaling_manager.recordInfo("Audio stream started")
         
-    async def initiate_acoustic_stream(self) -> None:
-        """Start acoustic streaming (alias for start_stream)"""
-        return await self.start_stream()
+    initiate_acoustic_stream = start_stream
         
     async def stop_stream(self) -> bytes:
         """
@@ -316,39 +576,94 @@ class PrimaryAcousticArea:
         Returns:
             bytes: Collected audio data
         """
-        data = self.current_stream
+        data = b''
+        if self.current_stream is not None:
+            with memoryview(self.current_stream) as view:
+                data = bytes(view[:self._stream_w])
         self.current_stream = None
+        self._last_analysis = None  # Don't pin the last analyzed buffer past the stream
         journaling_manager.recordInfo("Audio stream stopped")
         return data
         
-    async def terminate_acoustic_stream(self) -> bytes:
-        """Stop acoustic streaming and return collected data (alias for stop_stream)"""
-        return await self.stop_stream()
+    terminate_acoustic_stream = stop_stream
         
     async def add_to_stream(self, chunk: bytes) -> None:
         """Add chunk to current audio stream"""
         if self.current_stream is not None:
-            self.current_stream += chunk
+            # Write at the cursor; past the preallocated end this extends in place
+            end = self._stream_w + len(chunk)
+            self.current_stream[self._stream_w:end] = chunk
+            self._stream_w = end
             
-    async def append_to_stream(self, chunk: bytes) -> None:
-        """Append chunk to current acoustic stream (alias for add_to_stream)"""
-        return await self.add_to_stream(chunk)
+        if self.vad_active:
+            try:
+                await self._feed_vad(chunk)
+            except (AcousticProcessingError, OSError, asyncio.TimeoutError) as e:
+                journaling_manager.recordError(f"VAD dispatch error: {e}")
+            
+    append_to_stream = add_to_stream
 
     async def record_acoustic_signal(self, duration: float) -> bytes:
         """Record audio for specified duration"""
         try:
-            # Use NeurocorticalBridge instead of direct SynapticPathways call
-            from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
-            
             response = await NeurocorticalBridge.execute_operation(
                 operation="record_audio", 
                 data={"duration": duration}
             )
             return response.get("audio_data", b"")
-        except Exception as e:
+        except (AcousticProcessingError, OSError, asyncio.TimeoutError) as e:
             journaling_manager.recordError(f"Error recording audio: {e}")
             return b""
             
+    def _frame_view(self, audio_data: bytes) -> np.ndarray:
+        """
+        View 16-bit PCM as whole VAD frames without copying
+        
+        Args:
+            audio_data: Raw 16-bit PCM
+            
+        Returns:
+            np.ndarray: (frames, frame_samples) int16 view; a trailing partial frame is dropped
+        """
+        samples = np.frombuffer(audio_data, dtype=np.int16, count=len(audio_data) // 2)
+        count = samples.size // self._frame_samples
+        return samples[:count * self._frame_samples].reshape(count, self._frame_samples)
+        
+    async def analyze_acoustic(self, audio_data: bytes) -> Dict[str, Any]:
+        """
+        Analyze frequency, amplitude and temporal features of auditory input together
+        
+        All three analyses run locally on one zero-copy view of the PCM, with no bridge
+        round trip. The result is kept for the buffer so the individual analysis
+        methods can reuse it, until the stream stops or the area is cleaned up.
+        Callers get copies of the analysis dicts, so changing them leaves the kept
+        result alone.
+        
+        Args:
+            audio_data: Raw auditory data
+            
+        Returns:
+            Dict[str, Any]: Frequency, amplitude and temporal analysis data
+        """
+        if self._last_analysis is not None and self._last_analysis[0] is audio_data:
+            return {key: dict(part) for key, part in self._last_analysis[1].items()}
+            
+        result = {
+            "frequency": await self._analyze_auditory_frequency(audio_data),
+            "amplitude": await self._analyze_auditory_amplitude(audio_data),
+            "temporal": await self._extract_auditory_temporal_features(audio_data)
+        }
+        # Only immutable buffers can be matched by identity later
+        if isinstance(audio_data, bytes):
+            self._last_analysis = (audio_data, {key: dict(part) for key, part in result.items()})
+        return result
+        
+    def _cached_analysis(self, audio_data: bytes, key: str) -> Optional[Dict[str, Any]]:
+        """Part of the last combined analysis, if it was for this same buffer"""
+        if self._last_analysis is not None and self._last_analysis[0] is audio_data:
+            return dict(self._last_analysis[1][key])
+        return None
+        
     async def _analyze_auditory_frequency(self, audio_data: bytes) -> Dict[str, Any]:
         """
         Analyze frequency components of auditory input
@@ -359,22 +674,28 @@ class PrimaryAcousticArea:
         Returns:
             Dict[str, Any]: Frequency analysis data
         """
-        try:
-            # Use NeurocorticalBridge instead of direct SynapticPathways call
-            from Mind.Subcortex.neurocortical_bridge import NeurocorticalBridge
+        cached = self._cached_analysis(audio_data, "frequency")
+        if cached is not None:
+            return cached
             
-            response = await NeurocorticalBridge.execute_operation(
-                operation="analyze_frequency",
-                data={"audio_data": audio_data}
-            )
-            return response.get("frequency_data", {})
-        except Exception as e:
+        try:
+            frames = self._frame_view(audio_data)
+            if not len(frames):
+                return {}
+                
+            # One batched real FFT over all VAD frames
+            spectra = np.abs(np.fft.rfft(frames * self._fft_window, axis=1))
+            freqs = np.fft.rfftfreq(self._frame_samples, 1.0 / CONFIG.sample_rate)
+            return {
+                "frame_samples": self._frame_samples,
+                "dominant_frequencies": freqs[spectra[:, 1:].argmax(axis=1) + 1].tolist(),
+                "spectrum": spectra.mean(axis=0).tolist()
+            }
+        except ValueError as e:
             journaling_manager.recordError(f"Error analyzing auditory frequency: {e}")
             return {}
             
-    async def _analyze_frequency(self, audio_data: bytes) -> Dict[str, Any]:
-        """Analyze frequency components (alias for _analyze_auditory_frequency)"""
-        return await self._analyze_auditory_frequency(audio_data)
+    _analyze_frequency = _analyze_auditory_frequency
             
     async def _analyze_auditory_amplitude(self, audio_data: bytes) -> Dict[str, Any]:
         """
@@ -386,19 +707,24 @@ class PrimaryAcousticArea:
         Returns:
             Dict[str, Any]: Amplitude analysis data
         """
+        cached = self._cached_analysis(audio_data, "amplitude")
+        if cached is not None:
+            return cached
+            
         try:
-            response = await SynapticPathways.send_system_command(
-                command_type="process_amplitude",
-                data={"audio_data": audio_data}
-            )
-            return response.get("amplitude_data", {})
-        except Exception as e:
+            samples = np.frombuffer(audio_data, dtype=np.int16, count=len(audio_data) // 2)
+            if not samples.size:
+                return {}
+                
+            # Two vectorized reductions instead of a system command round trip
+            rms = float(np.sqrt(np.mean(np.square(samples, dtype=np.float32))))
+            peak = int(np.abs(samples.astype(np.int32)).max())
+            return {"rms": rms, "peak": peak}
+        except ValueError as e:
             journaling_manager.recordError(f"Error analyzing auditory amplitude: {e}")
             return {}
             
-    async def _process_amplitude(self, audio_data: bytes) -> Dict[str, Any]:
-        """Process audio amplitude (alias for _analyze_auditory_amplitude)"""
-        return await self._analyze_auditory_amplitude(audio_data)
+    _process_amplitude = _analyze_auditory_amplitude
             
     async def _extract_auditory_temporal_features(self, audio_data: bytes) -> Dict[str, Any]:
         """
@@ -410,19 +736,29 @@ class PrimaryAcousticArea:
         Returns:
             Dict[str, Any]: Temporal feature data
         """
+        cached = self._cached_analysis(audio_data, "temporal")
+        if cached is not None:
+            return cached
+            
         try:
-            response = await SynapticPathways.send_system_command(
-                command_type="extract_temporal",
-                data={"audio_data": audio_data}
-            )
-            return response.get("temporal_data", {})
-        except Exception as e:
+            frames = self._frame_view(audio_data)
+            if not len(frames):
+                return {}
+                
+            # Per-frame short-time energy and zero-crossing rate, vectorized over all frames
+            samples = frames.astype(np.float32)
+            energy = np.mean(samples * samples, axis=1)
+            crossings = np.count_nonzero(np.diff(np.signbit(frames), axis=1), axis=1)
+            return {
+                "frame_samples": self._frame_samples,
+                "energy": energy.tolist(),
+                "zero_crossing_rate": (crossings / (self._frame_samples - 1)).tolist()
+            }
+        except ValueError as e:
             journaling_manager.recordError(f"Error extracting auditory temporal features: {e}")
             return {}
             
-    async def _extract_temporal_features(self, audio_data: bytes) -> Dict[str, Any]:
-        """Extract temporal features (alias for _extract_auditory_temporal_features)"""
-        return await self._extract_auditory_temporal_features(audio_data)
+    _extract_temporal_features = _extract_auditory_temporal_features
 
     async def process_audio(self, audio_data: bytes) -> Dict[str, Any]:
         """Process raw audio data"""
@@ -449,6 +785,9 @@ class PrimaryAcousticArea:
         try:
             self._processing = False
             self._initialized = False
+            self._last_analysis = None
+            await self._close_playback_pipe()
+                
             journaling_manager.recordInfo("Primary acoustic area cleaned up")
             
         except Exception as e:
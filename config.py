@@ -76,6 +76,12 @@ class Config:
             "latency": 0.1,
             "buffer_size": 2048
         }
+        self.audio_device_name = "default"
+        self.vad_energy_threshold = 300  # Minimum RMS (16-bit PCM) treated as possible speech
+        self.audio_output_type = AudioOutputType.WAVESHARE
+        self.wake_word = "hey penphin"
+        self.tts_implementation = "local"
+        self.elevenlabs_voice_id = None
         
         # Visual settings
         self.visual_height = 32
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Acoustic Stream Test
+--------------------
+Tests the VAD ring buffer and local PCM normalization of the primary acoustic area.
+The bridge is stubbed, so no audio hardware or LLM connection is required.
+"""
+
+import sys
+import os
+import asyncio
+from unittest import mock
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.TemporalLobe.SuperiorTemporalGyrus.HeschlGyrus import primary_acoustic_area as acoustic
+
+def _feed_chunks(chunks):
+    """Feed chunks through VAD and return the area and the payloads sent to the bridge"""
+    sent = []
+
+    async def execute(command):
+        sent.append(bytes(command.data["audio_chunk"]))
+        return {}
+
+    async def run():
+        area = acoustic.PrimaryAcousticArea()
+        with mock.patch.object(acoustic.NeurocorticalBridge, "execute", side_effect=execute):
+            await area.start_vad()
+            for chunk in chunks:
+                await area.add_to_stream(chunk)
+        return area
+
+    area = asyncio.run(run())
+    return area, sent[1:]  # Drop start_vad's empty chunk
+
+def _check_dispatch(chunks):
+    area, sent = _feed_chunks(chunks)
+    frame_bytes = area._frame_samples * 2
+    data = b''.join(chunks)
+    dispatched = b''.join(sent)
+
+    # Every payload is whole frames, and bytes out are the bytes in minus the pending tail
+    assert all(len(block) and len(block) % frame_bytes == 0 for block in sent)
+    assert len(data) - len(dispatched) < frame_bytes
+    assert dispatched == data[:len(dispatched)]
+    assert area._ring_w - area._ring_r == len(data) - len(dispatched)
+
+def test_vad_ring_wraps():
+    # 333-byte chunks are not frame aligned and carry the write position across the ring end
+    rng = np.random.default_rng(7)
+    data = rng.integers(0, 256, size=3 * acoustic._RING_SIZE, dtype=np.uint8).tobytes()
+    _check_dispatch([data[i:i + 333] for i in range(0, len(data), 333)])
+
+def test_vad_chunk_larger_than_ring():
+    rng = np.random.default_rng(11)
+    chunks = [
+        rng.integers(0, 256, size=1001, dtype=np.uint8).tobytes(),
+        rng.integers(0, 256, size=200_000, dtype=np.uint8).tobytes(),
+        rng.integers(0, 256, size=77, dtype=np.uint8).tobytes(),
+    ]
+    _check_dispatch(chunks)
+
+def test_normalize_pcm():
+    # A negative full-scale peak must not overflow when taking its absolute value
+    samples = np.array([0, 1000, -32768, 16384], dtype=np.int16)
+    normalized = np.frombuffer(acoustic._normalize_pcm(samples.tobytes()), dtype=np.int16)
+    assert normalized.tolist() == [0, 1000, -32767, 16384]
+
+    samples = np.array([0, 100, -50, 200], dtype=np.int16)
+    normalized = np.frombuffer(acoustic._normalize_pcm(samples.tobytes()), dtype=np.int16)
+    assert normalized.tolist() == [0, 16384, -8192, 32767]
+
+def test_normalize_silence():
+    silence = bytes(64)
+    assert acoustic._normalize_pcm(silence) == silence
+    assert acoustic._normalize_pcm(b'') == b''
+
+if __name__ == "__main__":
+    test_vad_ring_wraps()
+    test_vad_chunk_larger_than_ring()
+    test_normalize_pcm()
+    test_normalize_silence()
+    print("✅ Acoustic stream tests passed")
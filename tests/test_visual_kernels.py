@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Visual Kernel Test
+------------------
+Tests that every Game of Life and region stamping kernel backend matches a
+plain NumPy reference. Runs without the LED matrix or any other hardware.
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Mind.OccipitalLobe.VisualCortex import _kernels
+
+def _optional_backends():
+    """Collect the compiled kernel backends that import on this machine"""
+    backends = []
+    if _kernels.NUMBA_AVAILABLE:
+        backends.append(("numba", _kernels.gol_step, _kernels.stamp_region))
+    try:
+        from Mind.OccipitalLobe.VisualCortex import _gol
+        backends.append(("cython", _gol.gol_step, _gol.stamp_region))
+    except ImportError:
+        pass
+    try:
+        from Mind.OccipitalLobe.VisualCortex import visual_kernels
+        backends.append(("aot", visual_kernels.gol_step, visual_kernels.stamp_region))
+    except ImportError:
+        pass
+    return backends
+
+def _reference_step(grid):
+    """Next generation and neighbor counts computed with np.roll"""
+    neighbors = sum(
+        np.roll(np.roll(grid, dy, axis=0), dx, axis=1).astype(np.int16)
+        for dy in (-1, 0, 1) for dx in (-1, 0, 1) if (dy, dx) != (0, 0)
+    )
+    new_grid = ((neighbors == 3) | ((grid == 1) & (neighbors == 2))).astype(np.uint8)
+    rgb = np.zeros((64, 64, 3), dtype=np.uint8)
+    alive = grid == 1
+    rgb[alive, 1] = np.minimum(255, neighbors[alive] * 40)
+    rgb[alive, 2] = 255 - neighbors[alive] * 20
+    return new_grid, rgb
+
+def _reference_stamp(grid, region, x, y):
+    """Stamp a region cell by cell, skipping cells outside the grid"""
+    for ry in range(region.shape[0]):
+        for rx in range(region.shape[1]):
+            if region[ry, rx] and 0 <= y + ry < 64 and 0 <= x + rx < 64:
+                grid[y + ry, x + rx] = 1
+
+def _test_grids():
+    """Random grids plus a glider wrapped across the corner"""
+    rng = np.random.default_rng(1234)
+    grids = [(rng.random((64, 64)) < p).astype(np.uint8) for p in (0.1, 0.3, 0.5, 0.9)]
+    corner = np.zeros((64, 64), dtype=np.uint8)
+    for y, x in ((63, 0), (0, 1), (1, 63), (1, 0), (1, 1)):
+        corner[y, x] = 1
+    grids.append(corner)
+    grids.append(np.ones((64, 64), dtype=np.uint8))
+    return grids
+
+def _check_gol_step(gol_step):
+    for grid in _test_grids():
+        expected_grid, expected_rgb = _reference_step(grid)
+        new_grid = np.zeros((64, 64), dtype=np.uint8)
+        rgb = np.full((64, 64, 3), 7, dtype=np.uint8)
+        padded = np.zeros((66, 66), dtype=np.uint8)
+        gol_step(grid.copy(), new_grid, rgb, padded)
+        assert np.array_equal(new_grid, expected_grid)
+        assert np.array_equal(rgb, expected_rgb)
+
+def _check_stamp_region(stamp_region):
+    rng = np.random.default_rng(5678)
+    offsets = [(0, 0), (-3, -5), (60, 61), (-10, 50), (63, 63), (-20, -20), (70, 2)]
+    for x, y in offsets:
+        region = (rng.random((12, 9)) < 0.5).astype(np.uint8)
+        grid = (rng.random((64, 64)) < 0.2).astype(np.uint8)
+        expected = grid.copy()
+        _reference_stamp(expected, region, x, y)
+        stamp_region(grid, region, x, y)
+        assert np.array_equal(grid, expected), (x, y)
+
+def test_bitboard_roundtrip():
+    grid = (np.random.default_rng(42).random((64, 64)) < 0.5).astype(np.uint8)
+    assert np.array_equal(_kernels.unpack_bitboard(_kernels.pack_bitboard(grid)), grid)
+
+def test_gol_step_numpy():
+    _check_gol_step(_kernels.gol_step_numpy)
+
+def test_stamp_region_numpy():
+    _check_stamp_region(_kernels.stamp_region_numpy)
+
+def test_compiled_kernels():
+    for name, gol_step, stamp_region in _optional_backends():
+        print(f"Checking {name} kernels")
+        _check_gol_step(gol_step)
+        _check_stamp_region(stamp_region)
+
+if __name__ == "__main__":
+    test_bitboard_roundtrip()
+    test_gol_step_numpy()
+    test_stamp_region_numpy()
+    test_compiled_kernels()
+    print("✅ Visual kernels match the reference")